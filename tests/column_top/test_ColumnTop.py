@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+import pytest
+import contextlib
+import numpy as np
+from tetris_ballistic.tetris_ballistic import Tetris_Ballistic
+
+
+def test_ColumnTop():
+    """
+    The incrementally maintained ColumnTop has to agree with a full scan of the substrate.
+    """
+    output_file = "test_ColumnTop_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        TB = Tetris_Ballistic(seed=42, width=30, height=60, steps=300)
+        TB.Simulate()
+        assert np.array_equal(TB.ColumnTop, TB._ComputeColumnTop())
+
+        TB.resize(new_height=40)
+        assert np.array_equal(TB.ColumnTop, TB._ComputeColumnTop())
+
+        TB.reset()
+        assert np.all(TB.ColumnTop == TB.height)
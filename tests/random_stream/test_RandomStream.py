@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import pytest
+import contextlib
+import numpy as np
+from tetris_ballistic.tetris_ballistic import Tetris_Ballistic, POSITION_RANGE
+
+
+def test_stream_ranges():
+    """
+    The pre-drawn positions have to stay in the valid range of each piece.
+    """
+    output_file = "test_RandomStream_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        TB = Tetris_Ballistic(seed=3, width=10, height=20)
+        sample_indices, positions = TB._DrawStream(20000)
+        for sample_index, position in zip(sample_indices, positions):
+            low, offset = POSITION_RANGE[sample_index // 2]
+            assert low <= position <= TB.width - offset
+        # Every position of the horizontal I piece is reachable
+        assert {p for k, p in zip(sample_indices, positions) if k // 2 == 1} == set(range(TB.width - 3))
+
+
+def test_stream_chunks():
+    """
+    Runs only depend on the seed of the instance, not on the chunk size of the stream.
+    """
+    output_file = "test_RandomStream_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        TB1 = Tetris_Ballistic(seed=5, width=20, height=80, steps=500)
+        TB2 = Tetris_Ballistic(seed=5, width=20, height=80, steps=500)
+        TB1.Simulate()
+        TB2.Simulate(chunk_size=37)
+        assert np.array_equal(TB1.substrate, TB2.substrate)
+        assert np.array_equal(TB1.SampleDist, TB2.SampleDist)
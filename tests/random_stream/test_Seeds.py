@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import pytest
+import contextlib
+import random
+import numpy as np
+from tetris_ballistic.tetris_ballistic import Tetris_Ballistic, spawn_seeds
+
+
+def test_instances_do_not_interfere():
+    """
+    Instances own their Generator: interleaving two runs does not change them, nor the global random states.
+    """
+    output_file = "test_Seeds_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        np_state, py_state = np.random.get_state()[1].copy(), random.getstate()
+
+        TB1 = Tetris_Ballistic(seed=11, width=20, height=60, steps=200)
+        TB1.Simulate()
+
+        TB2 = Tetris_Ballistic(seed=11, width=20, height=60, steps=200)
+        TB3 = Tetris_Ballistic(seed=12, width=20, height=60, steps=200)
+        TB2.reset()
+        TB3.reset()
+        i = j = 0
+        while i < TB2.steps:
+            Update, *_ = TB2.Sample_Tetris()
+            i = Update(i)
+            Update, *_ = TB3.Sample_Tetris()
+            j = Update(j)
+
+        TB4 = Tetris_Ballistic(seed=11, width=20, height=60, steps=200)
+        TB4.Simulate()
+
+        assert np.array_equal(TB1.substrate, TB4.substrate)
+        assert np.array_equal(np.random.get_state()[1], np_state)
+        assert random.getstate() == py_state
+
+
+def test_spawn_seeds():
+    """
+    Spawned seeds give reproducible and distinct streams.
+    """
+    output_file = "test_Seeds_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        substrates = []
+        for seed in spawn_seeds(42, 3) + spawn_seeds(42, 3):
+            TB = Tetris_Ballistic(seed=seed, width=20, height=60, steps=200)
+            TB.Simulate()
+            substrates.append(TB.substrate)
+
+        assert all(np.array_equal(substrates[k], substrates[k + 3]) for k in range(3))
+        assert not np.array_equal(substrates[0], substrates[1])
+        assert TB.config_data["seed"] is None
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import pytest
+import contextlib
+import numpy as np
+from tetris_ballistic.tetris_ballistic import Tetris_Ballistic
+
+
+def test_RunningStats():
+    """
+    The running-sum statistics have to agree with those computed from the full top envelope.
+    """
+    output_file = "test_RunningStats_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        TB = Tetris_Ballistic(seed=7, width=20, height=60, steps=200)
+        TB.reset()
+        i = 0
+        while i < TB.steps:
+            step = i
+            Update, *_ = TB.Sample_Tetris()
+            i = Update(i)
+            if i == -1:
+                break
+            top_envelope = TB._ComputeColumnTop() - 1
+            assert TB.AvergeHeight[step] == pytest.approx(np.mean(top_envelope))
+            assert TB.Fluctuation[step] == pytest.approx(np.std(top_envelope), abs=1e-12)
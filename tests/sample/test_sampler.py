@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+import pytest
+import contextlib
+import numpy as np
+from tetris_ballistic.tetris_ballistic import Tetris_Ballistic
+from tetris_ballistic.sampler import TetrominoSampler
+
+
+def test_sampler_distribution():
+    """
+    The alias table has to reproduce the normalized weights and never draw a zero-weight piece.
+    """
+    weights = np.zeros((20, 2))
+    weights[0] = [4, 1]
+    weights[3] = [11, 0]
+    weights[14] = [0, 2]
+    weights[19] = [1, 1]
+    sampler = TetrominoSampler(weights)
+
+    n = 400000
+    draws = sampler.draw(n, rng=np.random.default_rng(3))
+    freq = np.bincount(draws, minlength=40) / n
+    expected = weights.flatten() / weights.sum()
+    assert np.all(freq[expected == 0] == 0)
+    assert np.allclose(freq, expected, atol=5e-3)
+
+    single = [sampler.draw(rng=np.random.default_rng(k)) for k in range(200)]
+    assert all(expected[k] > 0 for k in single)
+
+    with pytest.raises(ValueError):
+        TetrominoSampler(np.zeros(40))
+
+
+def test_sampler_rebuilt_on_config_change():
+    """
+    Sample_Tetris has to pick up changes of config_data.
+    """
+    output_file = "test_sampler_output.txt"
+
+    with open(output_file, "w") as file, contextlib.redirect_stdout(file):
+
+        TB = Tetris_Ballistic(seed=12, width=16, height=20)
+        TB.Sample_Tetris()
+        sampler = TB._PieceSampler()
+        assert TB._PieceSampler() is sampler
+
+        TB.config_data = {f"Piece-{i}": [0, 0] for i in range(20)} | {"Piece-19": [0, 1]}
+        for _ in range(20):
+            Update, Type_id, rot, Sticky = TB.Sample_Tetris()
+            assert (Type_id, Sticky) == (7, True)
+        assert TB._PieceSampler() is not sampler
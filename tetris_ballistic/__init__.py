@@ -1,7 +1,9 @@
 from .tetris_ballistic import \
     Tetris_Ballistic, \
+    spawn_seeds, \
     load_density_from_config
 from .data_analysis_utilities import *
 from .image_loader import TetrominoImageLoader
+from .sampler import TetrominoSampler
 from .retrieve_default_configs import retrieve_default_configs
 from .sweep_parameters import sweep_parameters
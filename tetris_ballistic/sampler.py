@@ -0,0 +1,135 @@
+"""
+This module provides the sampler of Tetris pieces used by the Tetris
+Ballistic model. The 20 pieces, each either non-sticky or sticky, give 40
+outcomes whose weights come from the `Piece-x` entries of a configuration.
+
+The sampler is built once from the weights as an alias table (Vose's method),
+after which every draw costs one uniform random number and one table lookup,
+and any number of piece ids can be drawn in one vectorized call.
+
+Author:
+    Le Chen (chenle02@gmail.com / le.chen@auburn.edu)
+"""
+
+import numpy as np
+
+
+class TetrominoSampler:
+    """
+    An alias-table sampler over the 40 (piece, stickiness) outcomes.
+
+    The outcome ``2 * Piece_id + column`` refers to the piece ``Piece_id``
+    (0 -- 19), which is non-sticky if ``column == 0`` and sticky if
+    ``column == 1``. This is the same flat index as the one used in
+    `Tetris_Ballistic.Sample_Tetris`.
+
+    Attributes:
+        weights_key (tuple): The weights the table was built from, as returned by `config_key`.
+        size (int): The number of outcomes (40).
+        prob (numpy.ndarray): The acceptance probability of each slot of the alias table.
+        alias (numpy.ndarray): The alias of each slot of the alias table.
+
+    Args:
+        weights (array-like): The 20 x 2 (or flattened 40) non-negative weights of the pieces.
+
+    Raises:
+        ValueError: If a weight is negative or all weights are zero.
+
+    Example:
+        >>> sampler = TetrominoSampler.from_config(TB.config_data)
+        >>> sample_index = sampler.draw()
+        >>> sample_indices = sampler.draw(10000)
+    """
+
+    def __init__(self, weights):
+        flat_weights = np.asarray(weights, dtype=float).flatten()
+        total = np.sum(flat_weights)
+        if np.any(flat_weights < 0) or not total > 0:
+            raise ValueError("Piece weights must be non-negative and not all zero")
+
+        self.weights_key = tuple(flat_weights.tolist())
+        self.size = flat_weights.size
+
+        # Vose's alias method
+        scaled = flat_weights * self.size / total
+        prob = np.ones(self.size)
+        alias = np.arange(self.size)
+        small = [k for k in range(self.size) if scaled[k] < 1]
+        large = [k for k in range(self.size) if scaled[k] >= 1]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = scaled[g] + scaled[s] - 1
+            if scaled[g] < 1:
+                small.append(g)
+            else:
+                large.append(g)
+        # Whatever is left over only differs from 1 by rounding errors
+
+        self.prob = prob
+        self.alias = alias
+        # Python lists make single draws cheaper than indexing numpy arrays
+        self._prob_list = prob.tolist()
+        self._alias_list = alias.tolist()
+
+    @staticmethod
+    def config_key(config_data):
+        """
+        Extract the piece weights from a configuration.
+
+        Args:
+            config_data (dict): The configuration with entries 'Piece-0', ..., 'Piece-19'.
+
+        Returns:
+            tuple: The 40 weights, in the order of the flat outcome index.
+        """
+        return tuple(float(w) for i in range(20) for w in config_data[f"Piece-{i}"])
+
+    @classmethod
+    def from_config(cls, config_data):
+        """
+        Build the sampler from the 'Piece-x' entries of a configuration.
+
+        Args:
+            config_data (dict): The configuration with entries 'Piece-0', ..., 'Piece-19'.
+
+        Returns:
+            TetrominoSampler: The sampler.
+        """
+        return cls(cls.config_key(config_data))
+
+    def draw(self, size=None, rng=np.random):
+        """
+        Draw outcomes from the alias table.
+
+        Args:
+            size (int, optional): The number of outcomes to draw. If None, a single outcome is returned as an int.
+            rng (numpy.random.Generator or module, optional): The source of uniform random numbers. (Default: numpy.random)
+
+        Returns:
+            int or numpy.ndarray: The flat outcome index (or indices), ``2 * Piece_id + column``.
+        """
+        if size is None:
+            x = rng.random() * self.size
+            k = int(x)
+            return k if x - k < self._prob_list[k] else self._alias_list[k]
+
+        return self.lookup(rng.random(size))
+
+    def lookup(self, uniforms):
+        """
+        Map uniform random numbers on [0, 1) to outcomes.
+
+        One uniform number u gives both the slot ``k = floor(40 u)`` and the
+        coin ``40 u - k`` deciding between the slot and its alias.
+
+        Args:
+            uniforms (numpy.ndarray): Uniform random numbers on [0, 1).
+
+        Returns:
+            numpy.ndarray: The flat outcome indices, ``2 * Piece_id + column``.
+        """
+        x = np.asarray(uniforms) * self.size
+        k = x.astype(np.int64)
+        return np.where(x - k < self.prob[k], k, self.alias[k])
@@ -11,7 +11,6 @@ By Le Chen, Mauricio Montes and Ian Ruau
 """
 
 import numpy as np
-import random
 import yaml
 import re
 from scipy.stats import entropy
@@ -26,10 +25,23 @@ import os
 import joblib
 from functools import partial
 from tetris_ballistic.image_loader import TetrominoImageLoader
+from tetris_ballistic.sampler import TetrominoSampler
 from tetris_ballistic.retrieve_default_configs import retrieve_default_configs as rdc, configs_dir
 
 np.set_printoptions(threshold=np.inf)  # Make sure that print() displays the entire array
 
+# Range of the pivot position of each piece, indexed by Piece_id: the position
+# is drawn uniformly from {low, ..., width - offset} given as (low, offset).
+POSITION_RANGE = [(0, 2),                            # 0:  O
+                  (0, 4), (0, 1),                    # 1-2: I
+                  (0, 2), (2, 1), (1, 1), (0, 3),    # 3-6: L
+                  (1, 1), (2, 1), (0, 2), (0, 3),    # 7-10: J
+                  (1, 2), (0, 2), (1, 2), (1, 1),    # 11-14: T
+                  (1, 2), (1, 1),                    # 15-16: S
+                  (1, 2), (1, 1),                    # 17-18: Z
+                  (0, 1)]                            # 19: 1x1
+_POSITION_LOW, _POSITION_OFFSET = np.array(POSITION_RANGE).T
+
 
 class Tetris_Ballistic:
     """
@@ -50,7 +62,7 @@ class Tetris_Ballistic:
         width (int): The width of the game grid (multiple of 5). Default is 20.
         height (int): The height of the game grid. Default is 20.
         steps (int): The number of steps to simulate. Default is 400.
-        seed (int, optional): The seed for random number generation. If None, randomness is not controlled.
+        seed (int or numpy.random.SeedSequence, optional): The seed of the random number generator of this instance. If None, randomness is not controlled.
         density (dict, optional): The density of each piece. If None, uniform distribution is used.
         config_file (str, optional): The path to a YAML configuration file to be loaded. If None, default configuration is used.
 
@@ -148,11 +160,15 @@ class Tetris_Ballistic:
             self.width = width
             self.config_data["height"] = height
             self.height = height
-            self.config_data["seed"] = seed
+            # A SeedSequence (e.g., from spawn_seeds) cannot be written to a YAML file
+            self.config_data["seed"] = None if isinstance(seed, np.random.SeedSequence) else seed
             self.seed = seed
 
         self.FinalSteps = self.steps  # This is the final step number
         self.substrate = np.zeros((self.height, self.width), dtype=np.uint32)
+        # Row index of the first occupied cell of each column (self.height if empty)
+        self.ColumnTop = np.full(self.width, self.height, dtype=np.int64)
+        self._ResetHeightSums()
         self.PieceMap = [[-1, -1] for _ in range(20)]
         self.PieceMap[0] = [0, 0]
         self.PieceMap[1] = [1, 0]
@@ -180,6 +196,7 @@ class Tetris_Ballistic:
         self.AvergeHeight = np.zeros((self.steps))
         self.SampleDist = np.zeros([20, 2])
         self.log_time_slopes = None
+        self._sampler = None  # Built from config_data on first use, see _PieceSampler()
         self.UpdateCall = [
             _create_partial(self.Update_O, rot=0, sticky=False), _create_partial(self.Update_O, rot=0, sticky=True),    # 0
             _create_partial(self.Update_I, rot=0, sticky=False), _create_partial(self.Update_I, rot=0, sticky=True),    # 1
@@ -208,24 +225,30 @@ class Tetris_Ballistic:
         Set the seed for random number generation
         -----------------------------------------
 
-        This method sets the seed for both the built-in random module and
-        numpy's random module. It ensures that the seed is either a valid
-        integer or None. If None is provided, the seed is set to a random value
-        based on system time or another source of randomness.
+        This method creates the `numpy.random.Generator` `self.rng` owned by
+        this instance, from which all the randomness of the simulation is
+        drawn. The process-global random states of the built-in random module
+        and numpy's random module are left untouched, so several instances can
+        run side by side (also in threads) without interfering with each
+        other.
+
+        The seed is either a valid integer, a `numpy.random.SeedSequence`
+        (e.g., one of the independent streams given by `spawn_seeds`) or
+        None. If None is provided, the seed is set to a random value based on
+        system time or another source of randomness.
 
         :param seed: Seed value to set for random number generation. If None, a random seed is used.
-        :type seed: int or None
+        :type seed: int, numpy.random.SeedSequence or None
 
-        :raises ValueError: If the seed is not an integer or None.
+        :raises ValueError: If the seed is not an integer, a SeedSequence or None.
         """
-        if seed is not None:
+        if seed is not None and not isinstance(seed, np.random.SeedSequence):
             try:
                 seed = int(seed)
             except ValueError:
-                raise ValueError("Seed must be an integer or None")
+                raise ValueError("Seed must be an integer, a SeedSequence or None")
 
-        random.seed(seed)
-        np.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
 
     def load_config(self, filename):
         """
@@ -396,6 +419,7 @@ class Tetris_Ballistic:
         Reset the following attributes:
 
         - self.substrate
+        - self.ColumnTop
         - self.FinalSteps
         - self.Fluctuation
         - self.AvergeHeight
@@ -406,6 +430,8 @@ class Tetris_Ballistic:
             None
         """
         self.substrate = np.zeros((self.height, self.width))
+        self.ColumnTop = np.full(self.width, self.height, dtype=np.int64)
+        self._ResetHeightSums()
         self.FinalSteps = self.steps
         # self.HeightDynamics = np.zeros((self.steps, self.width))
         self.Fluctuation = np.zeros((self.steps))
@@ -437,6 +463,8 @@ class Tetris_Ballistic:
         # Update the height attribute to reflect the change
         old_height = self.height
         self.height = new_height
+        self.ColumnTop = self._ComputeColumnTop()
+        self._ResetHeightSums()
 
         # Update other attributes that depend on the height
         last_step = int(np.max(self.substrate))
@@ -452,7 +480,8 @@ class Tetris_Ballistic:
         -------------------------------------------------------------
 
         Samples a Tetris piece given the probability distribution specified in
-        the configuration file.
+        the configuration file. The sampling is done by an alias table (see
+        `TetrominoSampler`) that is only rebuilt when the configuration changes.
 
         There are 7 types Tetris pieces (type_id):
 
@@ -512,17 +541,7 @@ class Tetris_Ballistic:
             rot (int): rotation of the sampled piece (0-3).
             Sticky (bool): Whether the sampled piece is sticky or not.
         """
-        # Normalize the vector
-        probabilities = np.array([self.config_data[f"Piece-{i}"] for i in range(20)])
-
-        # Flatten the matrix to a 1D array for sampling
-        flattened_probabilities = probabilities.flatten()
-
-        # Normalize the flattened vector
-        normalized_probabilities = flattened_probabilities / np.sum(flattened_probabilities)
-
-        # Use normalized probabilities for sampling
-        sample_index = np.random.choice(40, p=normalized_probabilities)
+        sample_index = self._PieceSampler().draw(rng=self.rng)
 
         # Convert flat index back to 2D index
         Piece_id = sample_index // 2  # integer division to get row index
@@ -543,13 +562,35 @@ class Tetris_Ballistic:
 
         return Update, Type_id, rot, Sticky
 
-    def Simulate(self, compute_slope=False):
+    def _PieceSampler(self):
+        """
+        Return the alias-table sampler of the pieces for the current configuration.
+
+        The sampler is only rebuilt when the 'Piece-x' entries of
+        `self.config_data` have changed since it was last built.
+
+        Returns:
+            TetrominoSampler: The sampler of the flat index 2 * Piece_id + column.
+        """
+        key = TetrominoSampler.config_key(self.config_data)
+        sampler = getattr(self, "_sampler", None)
+        if sampler is None or sampler.weights_key != key:
+            sampler = TetrominoSampler(key)
+            self._sampler = sampler
+        return sampler
+
+    def Simulate(self, compute_slope=False, chunk_size=4096):
         """
         Start the simulation
         --------------------
 
+        The pieces, their stickiness and their positions are drawn in blocks
+        of `chunk_size` steps from `self.rng` (see `_DrawStream`), so a run
+        only depends on the seed of this instance.
+
         Args:
             compute_slope (bool): Whether to compute the slope of the surface or not. (Default: False)
+            chunk_size (int): The number of steps whose randomness is drawn at once. (Default: 4096)
 
         Return:
             None
@@ -557,8 +598,13 @@ class Tetris_Ballistic:
         self.reset()
         i = 0
         while i < self.steps:
-            Update, *_ = self.Sample_Tetris()
-            i = Update(i)
+            sample_indices, positions = self._DrawStream(min(chunk_size, self.steps - i))
+            for sample_index, position in zip(sample_indices, positions):
+                i = self.UpdateCall[sample_index](i, position=position)
+                self.SampleDist[sample_index // 2, sample_index % 2] += 1
+                if i == -1:
+                    break
+
             if i == -1:
                 print("Game Over, reach the top")
                 self.Fluctuation = self.Fluctuation[:self.FinalSteps]
@@ -570,15 +616,49 @@ class Tetris_Ballistic:
 
         self.PrintStatus(brief=True)
 
+    def _RandomPosition(self, Piece_id):
+        """
+        Draw the position of the pivot of a piece uniformly from its valid range.
+
+        Args:
+            Piece_id (int): The Id of the piece (0-19).
+
+        Returns:
+            int: The position of the pivot, see `POSITION_RANGE`.
+        """
+        low, offset = POSITION_RANGE[Piece_id]
+        return int(self.rng.integers(low, self.width - offset, endpoint=True))
+
+    def _DrawStream(self, n):
+        """
+        Draw the randomness of the next `n` steps from `self.rng`.
+
+        Each step consumes a pair of uniform random numbers: the first one
+        picks the piece (with its stickiness) from the alias table of
+        `_PieceSampler` and the second one the position, uniformly from the
+        range of the piece given by `POSITION_RANGE`. Hence the stream does
+        not depend on how the steps are split into chunks.
+
+        Args:
+            n (int): The number of steps.
+
+        Returns:
+            tuple: Two lists of length n, the flat sample indices (2 * Piece_id + column) and the positions.
+        """
+        uniforms = self.rng.random((n, 2))
+        sample_indices = self._PieceSampler().lookup(uniforms[:, 0])
+        low, offset = _POSITION_LOW[sample_indices // 2], _POSITION_OFFSET[sample_indices // 2]
+        positions = low + (uniforms[:, 1] * (self.width - offset - low + 1)).astype(np.int64)
+        return sample_indices.tolist(), positions.tolist()
+
     def _ffnz(self, column):
         """
         Finds the first non-zero entry in the specified column of the
         substrate.
 
-        This method scans the column from top to bottom (starting from index 0)
-        and returns the index of the first non-zero entry. If all entries in
-        the column are zero, a special value (indicating this condition) is
-        returned.
+        The index is read from `self.ColumnTop`, which is kept up to date by
+        the `_Place_*` methods, so the query takes constant time instead of
+        scanning the column from top to bottom.
 
         Args:
             column (int): The column index in the substrate to search in. It should
@@ -594,15 +674,54 @@ class Tetris_Ballistic:
             print("Column index is out of bounds")
             raise ValueError("Column index is out of bounds")
 
-        i = 0
-        flag = self.height
-        while (flag == self.height) and (i < self.height):
-            if self.substrate[i, column] == 0:
-                i = i + 1
-            else:
-                flag = i
+        return self.ColumnTop[column]
+
+    def _ComputeColumnTop(self):
+        """
+        Recompute the first occupied row of every column from the substrate.
+
+        This is only needed when the substrate is modified other than through
+        the `_Place_*` methods, e.g., after `resize`.
+
+        Returns:
+            numpy.ndarray (np.int64): The row index of the first non-zero entry in each column, or self.height if the column is empty.
+        """
+        occupied = self.substrate > 0
+        return np.where(occupied.any(axis=0), occupied.argmax(axis=0), self.height).astype(np.int64)
+
+    def _RaiseColumn(self, column, row):
+        """
+        Record that the cell (row, column) has been filled.
 
-        return flag
+        Besides `self.ColumnTop`, this keeps the running sums of the top
+        envelope used by `_UpdateStatus` in sync.
+
+        Args:
+            column (int): The column of the filled cell.
+            row (int): The row of the filled cell.
+
+        Return:
+            None
+        """
+        old_row = int(self.ColumnTop[column])
+        if row < old_row:
+            self.ColumnTop[column] = row
+            # The top envelope of a column is one row above its first occupied cell
+            old_envelope, new_envelope = old_row - 1, int(row) - 1
+            self._HeightSum += new_envelope - old_envelope
+            self._HeightSquareSum += new_envelope * new_envelope - old_envelope * old_envelope
+
+    def _ResetHeightSums(self):
+        """
+        Recompute the running sum and sum of squares of the top envelope from
+        `self.ColumnTop`.
+
+        Return:
+            None
+        """
+        top_envelope = [int(top) - 1 for top in self.ColumnTop]
+        self._HeightSum = sum(top_envelope)
+        self._HeightSquareSum = sum(h * h for h in top_envelope)
 
     def _Place_O(self, position, landing_row, i):
         """
@@ -623,8 +742,10 @@ class Tetris_Ballistic:
         self.substrate[landing_row - 2, position] = i
         self.substrate[landing_row - 1, position + 1] = i
         self.substrate[landing_row - 2, position + 1] = i
+        self._RaiseColumn(position, landing_row - 2)
+        self._RaiseColumn(position + 1, landing_row - 2)
 
-    def Update_O(self, i, rot=0, sticky=True):
+    def Update_O(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a square piece.
 
@@ -635,12 +756,13 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece. (No use, just be consistent with the others)
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         Returns:
             int: The particle ID or the step number that has been placed in this step.
                 + If the value is -1, it means it reaches to the top.
         """
-        position = random.randint(0, self.width - 2)
+        position = self._RandomPosition(0) if position is None else position
 
         next = i
 
@@ -694,14 +816,17 @@ class Tetris_Ballistic:
             self.substrate[landing_row - 1, position + 1] = i
             self.substrate[landing_row - 1, position + 2] = i
             self.substrate[landing_row - 1, position + 3] = i
+            for column in range(position, position + 4):
+                self._RaiseColumn(column, landing_row - 1)
         elif rot in [1, 3]:
             # Vertical
             self.substrate[landing_row - 1, position] = i
             self.substrate[landing_row - 2, position] = i
             self.substrate[landing_row - 3, position] = i
             self.substrate[landing_row - 4, position] = i
+            self._RaiseColumn(position, landing_row - 4)
 
-    def Update_I(self, i, rot=0, sticky=True):
+    def Update_I(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a line piece.
 
@@ -709,6 +834,7 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
                + rot = 0
                   - 1000
@@ -733,7 +859,7 @@ class Tetris_Ballistic:
 
         match rot:
             case 0 | 2:
-                position = random.randint(0, self.width - 4)
+                position = self._RandomPosition(1) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 1) + 1 if position > 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -759,7 +885,7 @@ class Tetris_Ballistic:
                 self._Place_I(position, landing_row, next, rot)
 
             case 1 | 3:
-                position = random.randint(0, self.width - 1)
+                position = self._RandomPosition(2) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 1) + 1 if position > 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -815,23 +941,33 @@ class Tetris_Ballistic:
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 3, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
+                self._RaiseColumn(position, landing_row - 3)
+                self._RaiseColumn(position + 1, landing_row - 1)
             case 1:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 1, position - 2] = i
                 self.substrate[landing_row - 2, position] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position - 1, landing_row - 1)
+                self._RaiseColumn(position - 2, landing_row - 1)
             case 2:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row, position] = i
                 self.substrate[landing_row + 1, position] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 1)
             case 3:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row - 1, position + 2] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position + 1, landing_row - 1)
+                self._RaiseColumn(position + 2, landing_row - 1)
 
-    def Update_L(self, i, rot=0, sticky=True):
+    def Update_L(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with an L piece.
 
@@ -854,6 +990,7 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         int: The particle ID or the step number that has been placed in this step.
             + If the value is -1, it means it reaches to the top.
@@ -861,7 +998,7 @@ class Tetris_Ballistic:
         next = i
         match rot:
             case 0:
-                position = random.randint(0, self.width - 2)
+                position = self._RandomPosition(3) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 1) + 1 if position > 0 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -883,7 +1020,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_L(position, landing_row, next, rot)
             case 1:
-                position = random.randint(2, self.width - 1)
+                position = self._RandomPosition(4) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 1) + 1 if position < self.width - 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -907,7 +1044,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_L(position, landing_row, next, rot)
             case 2:
-                position = random.randint(1, self.width - 1)
+                position = self._RandomPosition(5) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 1) + 1 if position < self.width - 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -929,7 +1066,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_L(position, landing_row - 2, next, rot)
             case 3:
-                position = random.randint(0, self.width - 3)
+                position = self._RandomPosition(6) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 3) + 2 if position < self.width - 3 and sticky else self.height
                 landing_row_right1 = self._ffnz(position + 1) + 1 if position < self.width - 1 else self.height
@@ -990,23 +1127,33 @@ class Tetris_Ballistic:
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 3, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
+                self._RaiseColumn(position, landing_row - 3)
+                self._RaiseColumn(position - 1, landing_row - 1)
             case 1:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 1, position - 2] = i
                 self.substrate[landing_row - 0, position] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 1)
+                self._RaiseColumn(position - 2, landing_row - 1)
             case 2:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row, position] = i
                 self.substrate[landing_row + 1, position] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position + 1, landing_row - 1)
             case 3:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row - 1, position + 2] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position + 1, landing_row - 1)
+                self._RaiseColumn(position + 2, landing_row - 1)
 
-    def Update_J(self, i, rot=0, sticky=True):
+    def Update_J(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a J piece.
 
@@ -1029,16 +1176,15 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         int: The particle ID or the step number that has been placed in this step.
             + If the value is -1, it means it reaches to the top.
         """
-        position = random.randint(0, self.width - 1)
-
         next = i
         match rot:
             case 0:
-                position = random.randint(1, self.width - 1)
+                position = self._RandomPosition(7) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 2) + 1 if position > 2 and sticky else self.height
                 landing_row_left = self._ffnz(position - 1) if position > 1 else self.height
@@ -1060,7 +1206,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_J(position, landing_row, next, rot)
             case 1:
-                position = random.randint(2, self.width - 1)
+                position = self._RandomPosition(8) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 1) + 1 if position < self.width - 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -1084,7 +1230,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_J(position, landing_row - 1, next, rot)
             case 2:
-                position = random.randint(0, self.width - 2)
+                position = self._RandomPosition(9) if position is None else position
 
                 landing_row_outright1 = self._ffnz(position + 1) + 1 if position < self.width - 1 and sticky else self._ffnz(position + 1) + 2
                 landing_row_outright2 = self._ffnz(position + 2) + 3 if position < self.width - 2 and sticky else self.height
@@ -1106,7 +1252,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_J(position, landing_row - 2, next, rot)
             case 3:
-                position = random.randint(0, self.width - 3)
+                position = self._RandomPosition(10) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 3) + 1 if position < self.width - 3 and sticky else self.height
                 landing_row_right1 = self._ffnz(position + 1) if position < self.width - 1 else self.height
@@ -1167,23 +1313,33 @@ class Tetris_Ballistic:
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 0, position] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position + 1, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 1)
             case 1:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 0, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position + 1, landing_row - 1)
             case 2:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 2, position] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position + 1, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 1)
             case 3:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 0, position] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position - 1, landing_row - 1)
 
-    def Update_T(self, i, rot=0, sticky=True):
+    def Update_T(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a T piece.
 
@@ -1206,6 +1362,7 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         Returns:
             int: The particle ID or the step number that has been placed in this step.
@@ -1214,7 +1371,7 @@ class Tetris_Ballistic:
         next = i
         match rot:
             case 0:
-                position = random.randint(1, self.width - 2)
+                position = self._RandomPosition(11) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 2) + 2 if position > 2 and sticky else self.height
                 landing_row_left = self._ffnz(position - 1) + 1 if position > 1 else self.height
@@ -1238,7 +1395,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_T(position, landing_row - 1, next, rot)
             case 1:
-                position = random.randint(0, self.width - 2)
+                position = self._RandomPosition(12) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 2) + 2 if position < self.width - 2 and sticky else self.height
                 landing_row_right = self._ffnz(position + 1) + 1 if position < self.width - 1 else self.height
@@ -1260,7 +1417,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_T(position, landing_row - 1, next, rot)
             case 2:
-                position = random.randint(1, self.width - 2)
+                position = self._RandomPosition(13) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 2) + 1 if position < self.width - 2 and sticky else self.height
                 landing_row_right = self._ffnz(position + 1) if position < self.width - 1 else self.height
@@ -1284,7 +1441,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_T(position, landing_row, next, rot)
             case 3:
-                position = random.randint(1, self.width - 1)
+                position = self._RandomPosition(14) if position is None else position
 
                 landing_row_outright = self._ffnz(position + 1) + 1 if position < self.width - 1 and sticky else self.height
                 landing_row_pivot = self._ffnz(position)
@@ -1336,13 +1493,18 @@ class Tetris_Ballistic:
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 2, position + 1] = i
                 self.substrate[landing_row - 2, position] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position - 1, landing_row - 1)
+                self._RaiseColumn(position + 1, landing_row - 2)
             case 1 | 3:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 0, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 2, position - 1] = i
+                self._RaiseColumn(position, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 2)
 
-    def Update_S(self, i, rot=0, sticky=True):
+    def Update_S(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with an S piece.
 
@@ -1358,6 +1520,7 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         Returns:
             int: The particle ID or the step number that has been placed in this step.
@@ -1366,7 +1529,7 @@ class Tetris_Ballistic:
         next = i
         match rot:
             case 0 | 2:
-                position = random.randint(1, self.width - 2)
+                position = self._RandomPosition(15) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 2) + 1 if position > 2 and sticky else self.height
                 landing_row_left = self._ffnz(position - 1) if position > 1 else self.height
@@ -1390,7 +1553,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_S(position, landing_row, next, rot)
             case 1 | 3:
-                position = random.randint(1, self.width - 1)
+                position = self._RandomPosition(16) if position is None else position
 
                 landing_row_outleft2 = self._ffnz(position - 2) + 2 if position > 2 and sticky else self.height
                 landing_row_outleft1 = self._ffnz(position - 1) + 1 if position > 1 else self.height
@@ -1442,13 +1605,18 @@ class Tetris_Ballistic:
                 self.substrate[landing_row - 1, position + 1] = i
                 self.substrate[landing_row - 2, position - 1] = i
                 self.substrate[landing_row - 2, position] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position + 1, landing_row - 1)
+                self._RaiseColumn(position - 1, landing_row - 2)
             case 1 | 3:
                 self.substrate[landing_row - 1, position] = i
                 self.substrate[landing_row - 2, position] = i
                 self.substrate[landing_row - 1, position - 1] = i
                 self.substrate[landing_row - 0, position - 1] = i
+                self._RaiseColumn(position, landing_row - 2)
+                self._RaiseColumn(position - 1, landing_row - 1)
 
-    def Update_Z(self, i, rot=0, sticky=True):
+    def Update_Z(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a Z piece.
 
@@ -1464,6 +1632,7 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece.
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         Returns:
             int: The particle ID or the step number that has been placed in this step.
@@ -1472,7 +1641,7 @@ class Tetris_Ballistic:
         next = i
         match rot:
             case 0 | 2:
-                position = random.randint(1, self.width - 2)
+                position = self._RandomPosition(17) if position is None else position
 
                 landing_row_outleft2 = self._ffnz(position - 2) + 2 if position > 2 and sticky else self.height
                 landing_row_outleft1 = self._ffnz(position - 1) + 1 if position > 1 else self.height
@@ -1496,7 +1665,7 @@ class Tetris_Ballistic:
                 next = i + 1
                 self._Place_Z(position, landing_row, next, rot)
             case 1 | 3:
-                position = random.randint(1, self.width - 1)
+                position = self._RandomPosition(18) if position is None else position
 
                 landing_row_outleft = self._ffnz(position - 2) + 1 if position > 2 and sticky else self.height
                 landing_row_left = self._ffnz(position - 1) if position > 1 else self.height
@@ -1534,8 +1703,9 @@ class Tetris_Ballistic:
             None
         """
         self.substrate[landing_row - 1, position] = i
+        self._RaiseColumn(position, landing_row - 1)
 
-    def Update_1x1(self, i, rot=0, sticky=True):
+    def Update_1x1(self, i, rot=0, sticky=True, position=None):
         """
         Updates the substrate with a 1x1 piece.
 
@@ -1543,12 +1713,13 @@ class Tetris_Ballistic:
             i (int): The step number.
             rot (int): The rotation of the piece. (No use, just be consistent with the others)
             sticky (bool): Whether the piece is sticky or not. (Default: True)
+            position (int, optional): The position of the pivot. If None, it is drawn uniformly from the valid range.
 
         Returns:
             int: The particle ID or the step number that has been placed in this step.
                 + If the value is -1, it means it reaches to the top.
         """
-        position = random.randint(0, self.width - 1)
+        position = self._RandomPosition(19) if position is None else position
 
         next = i
 
@@ -1609,7 +1780,7 @@ class Tetris_Ballistic:
         self.reset()
         i = 0
         while i < self.steps:
-            choice = [random.choice(my_list), random.choice(rotation_list)]
+            choice = [self.rng.choice(my_list), self.rng.choice(rotation_list)]
             match choice[0]:
                 case 0: i = self.Update_O(i)
                 case 1: i = self.Update_I(i, choice[1])
@@ -1649,33 +1820,24 @@ class Tetris_Ballistic:
 
     def _UpdateStatus(self, step):
         """
-        Compute the top envelope of a substrate.
+        Update the statistics of the top envelope of the substrate.
 
-        This function calculates the highest particle position in each column
-        of the substrate. Update the both HeightDynamics and Fluctuation
-        attributes of the substrate.
+        The average height and the fluctuation (the standard deviation of
+        the top envelope) are obtained from the running sum and sum of
+        squares of the top envelope, which `_RaiseColumn` updates for the
+        columns touched by the last piece. Hence this takes constant time.
 
         Args:
             step (int): The step number of the substrate.
         Returns:
             None
         """
-        # top_envelope = np.zeros(self.width)
-        # for pos in range(self.width):
-        #     if np.any(self.substrate[:, pos] > 0):  # If there's any nonzero value in the column
-        #         top_envelope[pos] = np.argmax(self.substrate[:, pos] > 0) - 1
-        #     else:
-        #         top_envelope[pos] = self.height - 1
-        top_envelope = self._TopEnvelop(step + 1)
-
         # self.HeightDynamics[step] = top_envelope
-        average = np.mean(top_envelope)
-        self.AvergeHeight[step] = average
+        self.AvergeHeight[step] = self._HeightSum / self.width
 
-        self.Fluctuation[step] = 0
-        for pos in range(self.width):
-            self.Fluctuation[step] += np.power(top_envelope[pos] - average, 2) / self.width
-        self.Fluctuation[step] = np.sqrt(self.Fluctuation[step])
+        # Var = (W * sum(h^2) - (sum h)^2) / W^2, evaluated exactly in integers
+        variance_numerator = self.width * self._HeightSquareSum - self._HeightSum * self._HeightSum
+        self.Fluctuation[step] = np.sqrt(variance_numerator) / self.width
 
     def count_holes(self):
         """
@@ -2243,6 +2405,26 @@ class Tetris_Ballistic:
         return images
 
 
+def spawn_seeds(seed, n):
+    """
+    Spawn independent seeds from one master seed.
+
+    The children of `numpy.random.SeedSequence(seed)` give statistically
+    independent streams, so one master seed is enough for many replicas,
+    e.g., ``[Tetris_Ballistic(seed=s) for s in spawn_seeds(42, 1000)]``.
+
+    Args:
+        seed (int or numpy.random.SeedSequence): The master seed.
+        n (int): The number of seeds to spawn.
+
+    Returns:
+        list of numpy.random.SeedSequence: The spawned seeds.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
 def _create_partial(func, *args, **kwargs):
     """
     Creates a partial function from the given function, with pre-specified